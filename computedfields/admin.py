@@ -9,7 +9,6 @@ from django.shortcuts import render
 from django.core.exceptions import ObjectDoesNotExist
 from .models import ComputedFieldsAdminModel, ContributingModelsModel
 from .resolver import active_resolver
-from .graph import ComputedModelsGraph
 from .settings import settings
 try:
     import pygments
@@ -50,7 +49,7 @@ class ComputedModelsAdmin(admin.ModelAdmin):
         cf_models = active_resolver.computed_models
         deps = {}
         for fieldname, field in cf_models.get(model).items():
-            deps[fieldname] = field._computed['depends']
+            deps[fieldname] = field._computed.depends
         data = dumps(deps, indent=4, sort_keys=True)
         if pygments:
             data = mark_safe(
@@ -136,11 +135,7 @@ class ComputedModelsAdmin(admin.ModelAdmin):
         dot = ''
         if Digraph:
             error = ''
-            graph = active_resolver._graph
-            if not graph:
-                # we are in map file mode - create new graph
-                graph = ComputedModelsGraph(active_resolver.computed_models)
-                graph.get_edgepaths()
+            graph, _, _ = active_resolver.get_graphs()
             dot = mark_safe(str(graph.get_dot()).replace('\n', ' '))
         return render(request, 'computedfields/graph.html', {'error': error, 'dot': dot})
 
@@ -152,12 +147,7 @@ class ComputedModelsAdmin(admin.ModelAdmin):
         dot = ''
         if Digraph:
             error = ''
-            graph = active_resolver._graph
-            if not graph:
-                # we are in map file mode - create new graph
-                graph = ComputedModelsGraph(active_resolver.computed_models)
-                graph.get_edgepaths()
-            uniongraph = graph.get_uniongraph()
+            _, _, uniongraph = active_resolver.get_graphs()
             dot = mark_safe(str(uniongraph.get_dot()).replace('\n', ' '))
         return render(request, 'computedfields/graph.html', {'error': error, 'dot': dot})
 
@@ -175,13 +165,8 @@ class ComputedModelsAdmin(admin.ModelAdmin):
         dot = ''
         if Digraph:
             error = ''
-            graph = active_resolver._graph
-            if not graph:
-                # we are in map file mode - create new graph
-                graph = ComputedModelsGraph(active_resolver.computed_models)
-                graph.get_edgepaths()
-                graph.get_uniongraph()
-            modelgraph = graph.modelgraphs.get(model, None)
+            _, modelgraphs, _ = active_resolver.get_graphs()
+            modelgraph = modelgraphs.get(model, None)
             if modelgraph:
                 dot = mark_safe(str(modelgraph.get_dot()).replace('\n', ' '))
             else:
@@ -7,14 +7,14 @@ removes redundant dependencies. Finally the dependencies are translated
 to the resolver map to be used later by ``update_dependent`` and in
 the signal handlers.
 """
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from os import PathLike
 from django.core.exceptions import FieldDoesNotExist
 from django.db.models import ForeignKey
 from computedfields.helper import pairwise, modelname, parent_to_inherited_path, skip_equal_segments
 
 # typing imports
-from typing import (Callable, Dict, FrozenSet, Generic, Hashable, Any, List, Optional, Sequence,
+from typing import (Callable, Deque, Dict, FrozenSet, Generic, Hashable, Any, List, Mapping, Optional, Sequence,
                     Set, Tuple, TypeVar, Type, Union)
 from typing_extensions import TypedDict
 from django.db.models import Model, Field
@@ -29,18 +29,31 @@ F = TypeVar('F', bound=Callable[..., Any])
 IDepends = Sequence[Tuple[str, Sequence[str]]]
 IDependsAppend = List[Tuple[str, Sequence[str]]]
 
-# _computed container
-class IComputedData(TypedDict):
-    depends: IDepends
-    func: Callable[[Model], Any]
-    select_related: Sequence[str]
-    prefetch_related: Sequence[Any]
-    querysize: Optional[int]
+class ComputedData:
+    """
+    Container of the computed field settings, attached as ``_computed``
+    to computed fields.
+    """
+    __slots__ = ('func', 'depends', 'select_related', 'prefetch_related', 'querysize')
+
+    def __init__(
+        self,
+        func: Callable[[Model], Any],
+        depends: IDepends,
+        select_related: Sequence[str],
+        prefetch_related: Sequence[Any],
+        querysize: Optional[int]
+    ):
+        self.func = func
+        self.depends = depends
+        self.select_related = select_related
+        self.prefetch_related = prefetch_related
+        self.querysize = querysize
 
 
 # django Field type extended by our _computed data attribute
 class IComputedField(Field, Generic[_ST, _GT]):
-    _computed: IComputedData
+    _computed: ComputedData
     creation_counter: int
 
 
@@ -448,12 +461,12 @@ class ComputedModelsGraph(Graph):
       are collected into the final lookup map.
     """
 
-    def __init__(self, computed_models: Dict[Type[Model], Dict[str, IComputedField]]):
+    def __init__(self, computed_models: Mapping[Type[Model], Dict[str, IComputedField]]):
         """
         ``computed_models`` is ``Resolver.computed_models``.
         """
         super(ComputedModelsGraph, self).__init__()
-        self._computed_models: Dict[Type[Model], Dict[str, IComputedField]] = computed_models
+        self._computed_models: Mapping[Type[Model], Dict[str, IComputedField]] = computed_models
         self.models: Dict[str, Type[Model]] = {}
         self.resolved: IResolvedDeps = self.resolve_dependencies(computed_models)
         self.cleaned_data: IGlobalDepsCleaned = self._clean_data(self.resolved['globalDeps'])
@@ -503,7 +516,7 @@ class ComputedModelsGraph(Graph):
                 fieldentry = global_deps.setdefault(model, {}).setdefault(field, {})
                 local_deps.setdefault(model, {}).setdefault(field, set())
 
-                depends: IDepends = real_field._computed['depends']
+                depends: IDepends = real_field._computed.depends
 
                 # fields contributed from multi table model inheritance need patched depends rules,
                 # so the relation paths match the changed model entrypoint
@@ -801,70 +814,116 @@ class ModelGraph(Graph):
         Remove redundant single edges. Also checks for cycles.
         *Note:* Other than intermodel dependencies local dependencies must always be cyclefree.
         """
-        paths: List[List[Edge]] = self.get_edgepaths()
+        # reachable nodes are tracked as int bitsets per node, which avoids
+        # the expensive linearization of all edge paths
+        index: Dict[Node, int] = {node: pos for pos, node in enumerate(self.nodes)}
+        left_edges: Dict[Node, List[Edge]] = {}
+        for edge in self.edges:
+            left_edges.setdefault(edge.left, []).append(edge)
+        reach: Dict[Node, int] = {}
+        for node in left_edges:
+            self._reach(node, left_edges, index, reach, {})
+
+        # edge left->right is redundant, if right is reachable from another edge of left
         remove: Set[Edge] = set()
-        for path1 in paths:
-            # we only cut single edge paths
-            if len(path1) > 1:
-                continue
-            left: Node = path1[0].left
-            right: Node = path1[-1].right
-            for path2 in paths:
-                if path2 == path1:
-                    continue
-                if right == path2[-1].right and left == path2[0].left:
-                    remove.add(path1[0])
+        for edges in left_edges.values():
+            for edge in edges:
+                bit = 1 << index[edge.right]
+                for other in edges:
+                    if other is not edge and reach.get(other.right, 0) & bit:
+                        remove.add(edge)
+                        break
         for edge in remove:
             self.remove_edge(edge)
 
-    def _tsort(
+    def _reach(
             self,
-            graph: Dict[Node, List[Node]],
-            start: Node,
-            paths: Dict[Node, List[Node]],
-            path: List[Node]
-    ):
-        """
-        Recursive deep first search variant of topsort.
-        Also accumulates any revealed subpaths.
-        """
-        for node in graph.get(start, []):
-            if not node in paths:
-                # accumulate revealed topological subpaths
-                paths[node] = self._tsort(graph, node, paths, [])
-            for snode in paths[node]:
-                # append node if its not yet part of the path
-                if not snode in path:
-                    path += [snode]
-        path += [start]
-        return path
+            node: Node,
+            left_edges: Dict[Node, List[Edge]],
+            index: Dict[Node, int],
+            reach: Dict[Node, int],
+            active: Dict[Node, None]
+    ) -> int:
+        """
+        Returns nodes reachable from `node` as bitset, memoized in `reach`.
+        `active` holds the current walk in order.
+        Raises a ``CycleEdgeException`` for cyclic graphs.
+        """
+        if node in reach:
+            return reach[node]
+        if node in active:
+            walk = list(active)
+            cycle = walk[walk.index(node):] + [node]
+            raise CycleEdgeException([Edge(*pair) for pair in pairwise(cycle)])
+        active[node] = None
+        mask = 0
+        for edge in left_edges.get(node, []):
+            mask |= (1 << index[edge.right]) | self._reach(edge.right, left_edges, index, reach, active)
+        del active[node]
+        reach[node] = mask
+        return mask
 
     def get_topological_paths(self) -> Dict[Node, List[Node]]:
         """
         Creates a map of all possible entry nodes and their topological update path
         (computed fields mro).
+
+        All paths follow one topological order of the whole graph (Kahn's algorithm),
+        thus the mro of any entry node is a subsequence of the full mro in '##'.
         """
         # create simplified parent-child relation graph
         graph: Dict[Node, List[Node]] = {}
+        in_degree: Dict[Node, int] = {}
         for edge in self.edges:
             graph.setdefault(edge.left, []).append(edge.right)
-        topological_paths: Dict[Node, List[Node]] = {}
-
-        # '##' has connections to all cfs thus creates the basic deps order map containing all cfs
-        # it also creates all tpaths between cfs itself
-        topological_paths[Node('##')] = self._tsort(graph, Node('##'), topological_paths, [])[:-1]
-
-        # we still need to reveal concrete field deps
-        # other than for cfs we also strip last entry (the field itself)
-        for node in graph:
-            if node in topological_paths:
+            in_degree.setdefault(edge.left, 0)
+            in_degree[edge.right] = in_degree.get(edge.right, 0) + 1
+
+        order: List[Node] = []
+        queue: Deque[Node] = deque(node for node, degree in in_degree.items() if not degree)
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for child in graph.get(node, []):
+                in_degree[child] -= 1
+                if not in_degree[child]:
+                    queue.append(child)
+        if len(order) < len(in_degree):
+            # nodes left with incoming edges all have a left parent, walking parents
+            # backwards always ends up in a cycle
+            parents: Dict[Node, Node] = {}
+            for edge in self.edges:
+                if in_degree[edge.left] and in_degree[edge.right]:
+                    parents[edge.right] = edge.left
+            walk: List[Node] = []
+            node = next(node for node, degree in in_degree.items() if degree)
+            while node not in walk:
+                walk.append(node)
+                node = parents[node]
+            cycle = walk[walk.index(node):] + [node]
+            cycle.reverse()
+            raise CycleEdgeException([Edge(*pair) for pair in pairwise(cycle)])
+
+        # collect reachable nodes backwards along the topological order
+        reach: Dict[Node, Set[Node]] = {}
+        for node in reversed(order):
+            nodes: Set[Node] = set()
+            for child in graph.get(node, []):
+                nodes.add(child)
+                nodes.update(reach[child])
+            reach[node] = nodes
+
+        # '##' has connections to all cfs thus its path is the basic deps order containing all cfs
+        # cfs contain themselves in their path, concrete fields only their dependent cfs
+        root = Node('##')
+        computed = reach.get(root, set())
+        position: Dict[Node, int] = {node: pos for pos, node in enumerate(order)}
+        topological_paths: Dict[Node, List[Node]] = {root: sorted(computed, key=position.__getitem__)}
+        for node in order:
+            if node == root:
                 continue
-            topological_paths[node] = self._tsort(graph, node, topological_paths, [])[:-1]
-
-        # reverse all tpaths
-        for entry, path in topological_paths.items():
-            topological_paths[entry] = path[::-1]
-
+            nodes = reach[node] | {node} if node in computed else reach[node]
+            topological_paths[node] = sorted(nodes, key=position.__getitem__)
         return topological_paths
 
     def generate_field_paths(self, tpaths: Dict[Node, List[Node]]) -> Dict[str, List[str]]:
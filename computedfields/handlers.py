@@ -146,7 +146,11 @@ def merge_qs_maps(
     Updates obj1 inplace and also returns it.
     """
     for model, [qs2, fields2] in obj2.items():
-        query_field = obj1.setdefault(model, [model._base_manager.none(), set()])
+        query_field = obj1.get(model)
+        if query_field is None:
+            # no need to seed with an empty queryset for a single source
+            obj1[model] = [qs2, set(fields2)]
+            continue
         query_field[0] = query_field[0].union(qs2)  # or'ed querysets
         query_field[1].update(fields2)              # add fields
     return obj1
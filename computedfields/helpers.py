@@ -1,4 +1,35 @@
+from typing import Any, Callable, Hashable, TypeVar
+
+_T = TypeVar('_T')
 
 
 def are_same(*args) -> bool:
     return len(set(args)) == 1
+
+
+def cf_memo(instance: Any, key: Hashable, func: Callable[[], _T]) -> _T:
+    """
+    Share an intermediate result between computed field methods of `instance`.
+
+    During a computed field update run by the resolver ``func()`` is evaluated
+    only once per `key`, all other computed fields of the same instance
+    get the memoized value. Outside of resolver updates (e.g. with ``compute``)
+    ``func`` is called directly.
+
+    .. code-block:: python
+
+        class Order(ComputedFieldsModel):
+            @computed(models.IntegerField(), depends=[('items', ['price'])])
+            def total(self):
+                return cf_memo(self, 'prices', self.get_prices)['total']
+
+            @computed(models.IntegerField(), depends=[('items', ['price'])])
+            def max_price(self):
+                return cf_memo(self, 'prices', self.get_prices)['max']
+    """
+    ctx = getattr(instance, '_cf_ctx', None)
+    if ctx is None:
+        return func()
+    if key not in ctx:
+        ctx[key] = func()
+    return ctx[key]
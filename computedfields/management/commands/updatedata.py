@@ -5,7 +5,7 @@ from django.apps import apps
 from json import loads
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import transaction, DEFAULT_DB_ALIAS
 
 from computedfields.models import active_resolver
 from computedfields.helper import modelname, slice_iterator
@@ -48,8 +48,8 @@ class Command(BaseCommand):
             '-m', '--mode',
             default='default',
             type=str,
-            choices=('loop', 'bulk', 'fast'),
-            help='Set explicit update mode, default: bulk/fast from settings.py.'
+            choices=('loop', 'bulk', 'fast', 'copy'),
+            help='Set explicit update mode, default: bulk/fast/copy from settings.py.'
         )
         parser.add_argument(
             '-q', '--querysize',
@@ -109,10 +109,12 @@ class Command(BaseCommand):
     @transaction.atomic
     def action_default(self, models, size, show_progress, mode=''):
         """
-        Runs either in fast or bulk mode, whatever was set in settings.
+        Runs either in fast, bulk or copy mode, whatever was set in settings.
         """
         if not mode:
             mode = 'fast' if settings.COMPUTEDFIELDS_FASTUPDATE else 'bulk'
+            if active_resolver._use_copyupdate(DEFAULT_DB_ALIAS):
+                mode = 'copy'
             print(f'Update mode: settings.py --> {mode}')
 
         print(f'Default querysize: {size}')
@@ -159,15 +161,24 @@ class Command(BaseCommand):
 
     def action_bulk(self, models, size, show_progress):
         active_resolver.use_fastupdate = False
+        active_resolver.use_copyupdate = False
         print('Update mode: bulk')
         self.action_default(models, size, show_progress, 'bulk')
 
     def action_fast(self, models, size, show_progress):
         active_resolver.use_fastupdate = True
-        active_resolver._batchsize = settings.COMPUTEDFIELDS_BATCHSIZE_FAST
+        active_resolver.use_copyupdate = False
         print('Update mode: fast')
         self.action_default(models, size, show_progress, 'fast')
 
+    def action_copy(self, models, size, show_progress):
+        active_resolver.use_copyupdate = True
+        print('Update mode: copy')
+        if not active_resolver._use_copyupdate(DEFAULT_DB_ALIAS):
+            fallback = 'fast' if active_resolver.use_fastupdate else 'bulk'
+            print(f'  copy_update needs PostgreSQL, falling back to {fallback}')
+        self.action_default(models, size, show_progress, 'copy')
+
     @transaction.atomic
     def action_loop(self, models, size, show_progress):
         print('Update mode: loop')
@@ -178,6 +189,7 @@ class Command(BaseCommand):
             # needed here, as we have no other API to announce the changed value
             from django.conf import settings as ds
             ds.COMPUTEDFIELDS_QUERYSIZE = size
+            settings.invalidate('COMPUTEDFIELDS_QUERYSIZE')
         for model in models:
             qs = model._base_manager.all()
             amount = qs.count()
@@ -3,6 +3,7 @@ from django.db import models
 from django.contrib.contenttypes.models import ContentType, ContentTypeManager
 from django.utils.translation import gettext_lazy as _
 from .resolver import active_resolver, _ComputedFieldsModelBase
+from .helpers import cf_memo
 
 __all__ = [
     'ComputedFieldsModel',
@@ -11,12 +12,14 @@ __all__ = [
     'precomputed',
     'compute',
     'update_computedfields',
+    'update_computedfields_bulk',
     'update_dependent',
     'preupdate_dependent',
     'has_computedfields',
     'get_computedfields',
     'is_computedfield',
     'get_contributing_fks',
+    'cf_memo',
     'ComputedFieldsAdminModel',
     'ContributingModelsModel'
 ]
@@ -76,6 +79,8 @@ ComputedField = active_resolver.computedfield_factory
 compute = active_resolver.compute
 #: Convenient access to :meth:`update_computedfields<.resolver.Resolver.update_computedfields>`.
 update_computedfields = active_resolver.update_computedfields
+#: Convenient access to :meth:`update_computedfields_bulk<.resolver.Resolver.update_computedfields_bulk>`.
+update_computedfields_bulk = active_resolver.update_computedfields_bulk
 #: Convenient access to :meth:`update_dependent<.resolver.Resolver.update_dependent>`.
 update_dependent = active_resolver.update_dependent
 #: Convenient access to :meth:`preupdate_dependent<.resolver.Resolver.preupdate_dependent>`.
@@ -2,25 +2,25 @@
 Contains the resolver logic for automated computed field updates.
 """
 import operator
-from collections import OrderedDict
-from functools import reduce
-from itertools import zip_longest
+from functools import lru_cache, reduce
+from itertools import chain, zip_longest
+from types import MappingProxyType
 
-from django.db import transaction
-from django.db.models import QuerySet
+from django.db import connections, transaction
+from django.db.models import Q, QuerySet, prefetch_related_objects
 from django.core.exceptions import FieldDoesNotExist
 
 from .helpers import are_same
 from .settings import settings
-from .graph import ComputedModelsGraph, ComputedFieldsException, Graph, ModelGraph
+from .graph import ComputedData, ComputedModelsGraph, ComputedFieldsException, Graph, ModelGraph
 from .helper import proxy_to_base_model, slice_iterator, subquery_pk
 from . import __version__
 
 from fast_update.fast import fast_update
 
 # typing imports
-from typing import (Any, Callable, Dict, Generator, Iterable, List, Optional, Sequence, Set,
-                    Tuple, Type, Union, cast, overload)
+from typing import (Any, Callable, Dict, FrozenSet, Generator, Iterable, List, Mapping, Optional,
+                    Sequence, Set, Tuple, Type, Union, cast, overload)
 from typing_extensions import TypedDict
 from django.db.models import Field, Model
 from .graph import IComputedField, IDepends, IFkMap, ILocalMroMap, ILookupMap, _ST, _GT, F
@@ -73,6 +73,14 @@ class Resolver:
           a resolver-wide map of models with computed fields (``computed_models``).
         - After that the resolver maps are created (see `graph.ComputedModelsGraph`).
     """
+    __slots__ = (
+        'models', 'computedfields', '_graph', '_computed_models', '_map', '_fk_map',
+        '_local_mro', '_local_mro_masks', '_m2m', '_proxymodels', '_plain_fields',
+        'use_fastupdate', 'use_copyupdate', '_load_depends_only',
+        '_get_local_mro_cached', '_get_update_fields_cached', '_get_bulk_plan_cached',
+        '_get_compute_funcs_cached',
+        '_sealed', '_initialized', '_map_loaded', '__weakref__'
+    )
 
     def __init__(self):
         # collector phase data
@@ -83,15 +91,23 @@ class Resolver:
 
         # resolving phase data and final maps
         self._graph: Optional[ComputedModelsGraph] = None
-        self._computed_models: Dict[Type[Model], Dict[str, IComputedField]] = {}
+        self._computed_models: Mapping[Type[Model], Dict[str, IComputedField]] = {}
         self._map: ILookupMap = {}
         self._fk_map: IFkMap = {}
         self._local_mro: ILocalMroMap = {}
+        self._local_mro_masks: Dict[Type[Model], Dict[int, List[str]]] = {}
         self._m2m: IM2mMap = {}
         self._proxymodels: Dict[Type[Model], Type[Model]] = {}
+        self._plain_fields: Dict[Type[Model], FrozenSet[str]] = {}
         self.use_fastupdate: bool = settings.COMPUTEDFIELDS_FASTUPDATE
-        self._batchsize: int = (settings.COMPUTEDFIELDS_BATCHSIZE_FAST
-            if self.use_fastupdate else settings.COMPUTEDFIELDS_BATCHSIZE_BULK)
+        self.use_copyupdate: bool = settings.COMPUTEDFIELDS_COPYUPDATE
+        self._load_depends_only: bool = settings.COMPUTEDFIELDS_LOAD_DEPENDS_ONLY
+
+        # memoized local mro lookups, cleared on map (re)loading
+        self._get_local_mro_cached = lru_cache(maxsize=512)(self._resolve_local_mro)
+        self._get_update_fields_cached = lru_cache(maxsize=512)(self._resolve_update_fields)
+        self._get_bulk_plan_cached = lru_cache(maxsize=512)(self._resolve_bulk_plan)
+        self._get_compute_funcs_cached = lru_cache(maxsize=512)(self._resolve_compute_funcs)
 
         # some internal states
         self._sealed: bool = False        # initial boot phase
@@ -136,7 +152,7 @@ class Resolver:
         if not self._sealed:
             raise ResolverException('resolver must be sealed before accessing models or fields')
 
-        field_ids: List[int] = [f.creation_counter for f in self.computedfields]
+        field_ids: Set[int] = set(f.creation_counter for f in self.computedfields)
         for model in self.models:
             fields = set()
             for field in model._meta.fields:
@@ -157,16 +173,18 @@ class Resolver:
         if not self._sealed:
             raise ResolverException('resolver must be sealed before accessing models or fields')
 
+        # reverse index of field creation_counter --> models (single pass over all model fields)
+        # note: field.model cannot be used here, as abstract, proxy and multi table
+        # inheritance spread a computed field over several models
+        models_by_id: Dict[int, Set[Type[Model]]] = {}
+        for model in self.models:
+            for f in model._meta.fields:
+                models_by_id.setdefault(f.creation_counter, set()).add(model)
         for field in self.computedfields:
-            models = set()
-            for model in self.models:
-                for f in model._meta.fields:
-                    if hasattr(field, '_computed') and f.creation_counter == field.creation_counter:
-                        models.add(model)
-            yield (field, models)
+            yield (field, models_by_id.get(field.creation_counter, set()))
 
     @property
-    def computed_models(self) -> Dict[Type[Model], Dict[str, IComputedField]]:
+    def computed_models(self) -> Mapping[Type[Model], Dict[str, IComputedField]]:
         """
         Mapping of `ComputedFieldModel` models and their computed fields.
 
@@ -179,6 +197,8 @@ class Resolver:
             The resolver will only list models here, that actually have
             a computed field defined. A model derived from `ComputedFieldsModel`
             without a computed field will not be listed.
+
+            The mapping is read-only after the resolver got initialized.
         """
         if self._initialized:
             return self._computed_models
@@ -199,6 +219,24 @@ class Resolver:
 
         return computed_models
 
+    def extract_plain_fields(self) -> Dict[Type[Model], FrozenSet[str]]:
+        """
+        Creates a mapping of models and their computed fields, that are not
+        guarded by a data descriptor on the model class. Values of those fields
+        can be written directly into the instance ``__dict__``.
+        (Fields with a data descriptor are e.g. foreign key attnames.)
+        Models with a custom ``__setattr__`` (e.g. dirty tracking) get no plain fields,
+        so every write still goes through it.
+        """
+        plain: Dict[Type[Model], FrozenSet[str]] = {}
+        for model, fields in self._computed_models.items():
+            if model.__setattr__ is not object.__setattr__:
+                plain[model] = frozenset()
+                continue
+            plain[model] = frozenset(
+                name for name in fields if not hasattr(getattr(model, name, None), '__set__'))
+        return plain
+
     def initialize(self, models_only: bool = False) -> None:
         """
         Entrypoint for ``app.ready`` to seal the resolver and trigger
@@ -212,7 +250,9 @@ class Resolver:
         """
         # resolver must be sealed before doing any map calculations
         self.seal()
-        self._computed_models = self.extract_computed_models()
+        # the model mapping is frozen, as it is the single source of truth for all maps
+        self._computed_models = MappingProxyType(self.extract_computed_models())
+        self._plain_fields = self.extract_plain_fields()
         self._initialized = True
         if not models_only:
             self.load_maps()
@@ -239,6 +279,11 @@ class Resolver:
         self._local_mro = self._graph.generate_local_mro_map()
         self._extract_m2m_through()
         self._patch_proxy_models()
+        self._local_mro_masks = {}
+        self._get_local_mro_cached.cache_clear()
+        self._get_update_fields_cached.cache_clear()
+        self._get_bulk_plan_cached.cache_clear()
+        self._get_compute_funcs_cached.cache_clear()
         self._map_loaded = True
 
     def _extract_m2m_through(self) -> None:
@@ -249,7 +294,7 @@ class Resolver:
         """
         for model, fields in self.computed_models.items():
             for _, real_field in fields.items():
-                depends = real_field._computed['depends']
+                depends = real_field._computed.depends
                 for path, _ in depends:
                     if path == 'self':
                         continue
@@ -297,20 +342,158 @@ class Resolver:
         dependent computed field values in one pass.
 
         Returns computed fields as self dependent to simplify local field dependency calculation.
+
+        .. NOTE::
+            Results are memoized per `model` and `update_fields` combination,
+            thus the returned list must not be altered by the caller.
+        """
+        return self._get_local_mro_cached(
+            model, None if update_fields is None else frozenset(update_fields))
+
+    def _resolve_local_mro(
+        self,
+        model: Type[Model],
+        update_fields: Optional[FrozenSet[str]]
+    ) -> List[str]:
+        """
+        Uncached local `MRO` resolution backing ``get_local_mro``.
         """
-        # TODO: investigate - memoization of update_fields result? (runs ~4 times faster)
         entry = self._local_mro.get(model)
         if not entry:
             return []
         if update_fields is None:
             return entry['base']
-        update_fields = frozenset(update_fields)
         base = entry['base']
         fields = entry['fields']
         mro = 0
         for field in update_fields:
             mro |= fields.get(field, 0)
-        return [name for pos, name in enumerate(base) if mro & (1 << pos)]
+        # different update_fields often end up with the same bitmask,
+        # thus share the filtered mro lists per mask
+        masks = self._local_mro_masks.get(model)
+        if masks is None:
+            masks = self._local_mro_masks[model] = {(1 << len(base)) - 1: base}
+        result = masks.get(mro)
+        if result is None:
+            result = masks[mro] = [name for pos, name in enumerate(base) if mro & (1 << pos)]
+        return result
+
+    def _resolve_update_fields(
+        self,
+        model: Type[Model],
+        update_fields: FrozenSet[str]
+    ) -> FrozenSet[str]:
+        """
+        Uncached `update_fields` expansion by local computed fields,
+        backing ``update_computedfields``.
+        """
+        return update_fields | frozenset(self._get_local_mro_cached(model, update_fields))
+
+    def _resolve_bulk_plan(
+        self,
+        model: Type[Model],
+        update_fields: Optional[FrozenSet[str]]
+    ) -> Tuple[List[str], FrozenSet[str], Tuple[str, ...], Tuple[Any, ...], Tuple[str, ...]]:
+        """
+        Uncached resolution of `mro`, computed fields, their `select_related`
+        and `prefetch_related` rules and the local fields to load for ``bulk_updater``.
+        """
+        mro = self._get_local_mro_cached(model, update_fields)
+        fields = frozenset(mro)
+        select = tuple(self.get_select_related(model, fields))
+        prefetch = tuple(self.get_prefetch_related(model, fields))
+        return (
+            mro,
+            fields,
+            select,
+            prefetch,
+            self._get_local_reads(model, mro, select, prefetch)
+        )
+
+    def _get_local_reads(
+        self,
+        model: Type[Model],
+        mro: Iterable[str],
+        select: Iterable[str],
+        prefetch: Iterable[Any]
+    ) -> Tuple[str, ...]:
+        """
+        Concrete fields needed to evaluate the computed fields in `mro`
+        as declared by their `depends`, `select_related` and `prefetch_related` rules.
+        Relations followed by `select_related` are narrowed to their declared fields as well,
+        if all their hops are covered by `depends`.
+        Used with ``COMPUTEDFIELDS_LOAD_DEPENDS_ONLY`` to narrow the loaded columns.
+        """
+        reads: Set[str] = {model._meta.pk.name}
+        paths: Dict[str, Set[str]] = {}
+        for fieldname in mro:
+            reads.add(fieldname)
+            for path, fieldnames in self._computed_models[model][fieldname]._computed.depends:
+                if path == 'self':
+                    reads.update(fieldnames)
+                else:
+                    reads.add(path.split('.', 1)[0])
+                    paths.setdefault(path, set()).update(fieldnames)
+        through = [getattr(lookup, 'prefetch_through', lookup) for lookup in prefetch]
+        for lookup in select:
+            reads.add(lookup.split('__', 1)[0])
+        for lookup in through:
+            reads.add(lookup.split('__', 1)[0])
+        local: List[str] = []
+        for name in reads:
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if field.concrete and not field.many_to_many:
+                local.append(name)
+        return tuple(sorted(local + self._get_related_reads(model, paths, select, through)))
+
+    def _get_related_reads(
+        self,
+        model: Type[Model],
+        paths: Dict[str, Set[str]],
+        select: Iterable[str],
+        through: List[str]
+    ) -> List[str]:
+        """
+        Lookups of related concrete fields along the `select_related` rules,
+        derived from the `depends` paths given in `paths`. A lookup not covered by `depends`
+        is skipped, which leaves the related model fully loaded.
+        """
+        lookups = list(select) + through
+        related: Set[str] = set()
+        for lookup in select:
+            dotted = lookup.replace('__', '.')
+            if not any(path == dotted or path.startswith(dotted + '.') for path in paths):
+                continue
+            parts = lookup.split('__')
+            reads: List[str] = []
+            cls = model
+            for i, part in enumerate(parts):
+                try:
+                    field = cls._meta.get_field(part)
+                except FieldDoesNotExist:
+                    break
+                if not (field.many_to_one or field.one_to_one):
+                    break
+                cls = field.related_model
+                prefix = '__'.join(parts[:i + 1])
+                names = set(paths.get(prefix.replace('__', '.'), ()))
+                for other in chain(paths, lookups):
+                    other = other.replace('.', '__')
+                    if other.startswith(prefix + '__'):
+                        names.add(other[len(prefix) + 2:].split('__', 1)[0])
+                for name in names:
+                    try:
+                        target = cls._meta.get_field(name)
+                    except FieldDoesNotExist:
+                        continue
+                    if target.concrete and not target.many_to_many:
+                        reads.append(prefix + '__' + name)
+            else:
+                related.update(reads)
+        return list(related)
 
     def _querysets_for_update(
         self,
@@ -324,7 +507,7 @@ class Resolver:
         Returns a mapping of all dependent models, dependent fields and a
         queryset containing all dependent objects.
         """
-        final: Dict[Type[Model], List[Any]] = OrderedDict()
+        final: Dict[Type[Model], List[Any]] = {}
         modeldata = self._map.get(model)
         if not modeldata:
             return final
@@ -342,11 +525,10 @@ class Resolver:
         # thus we extract pks explicitly instead
         # TODO: cleanup type mess here including this workaround
         if isinstance(instance, QuerySet):
-            from django.db import connections
             if not instance.query.can_filter() and connections[instance.db].vendor == 'mysql':
                 instance = set(instance.values_list('pk', flat=True).iterator())
 
-        model_updates: Dict[Type[Model], Tuple[Set[str], Set[str]]] = OrderedDict()
+        model_updates: Dict[Type[Model], Tuple[Set[str], Set[str]]] = {}
         for update in updates:
             # first aggregate fields and paths to cover
             # multiple comp field dependencies
@@ -366,19 +548,30 @@ class Resolver:
                 # narrow updates to the single signal instance
                 queryset = model._base_manager.filter(pk=m2m.pk)
             else:
-                queryset: Any = model._base_manager.none()
                 query_pipe_method = self._choose_optimal_query_pipe_method(paths)
-                queryset = reduce(
-                    query_pipe_method,
-                    (model._base_manager.filter(**{path+subquery: instance}) for path in paths),
-                    queryset
-                )
+                if query_pipe_method is operator.or_:
+                    # single filter with or'ed conditions, saves a queryset clone per path
+                    queryset = model._base_manager.filter(
+                        reduce(operator.or_, (Q(**{path+subquery: instance}) for path in paths)))
+                else:
+                    # union over pk only subqueries, the outer pk__in filter
+                    # keeps the queryset filterable for later stages
+                    pks = reduce(
+                        query_pipe_method,
+                        (model._base_manager.filter(**{path+subquery: instance}).values('pk')
+                            for path in paths)
+                    )
+                    queryset = model._base_manager.filter(pk__in=subquery_pk(pks, pks.db))
             if pk_list:
                 # need pks for post_delete since the real queryset will be empty
                 # after deleting the instance in question
                 # since we need to interact with the db anyways
                 # we can already drop empty results here
-                queryset = set(queryset.values_list('pk', flat=True).iterator())
+                pks = queryset.values_list('pk', flat=True)
+                if not pks.query.combinator and len(pks.query.alias_map) > 1:
+                    # joins might multiply rows, let the db dedup the pks
+                    pks = pks.distinct()
+                queryset = set(pks.iterator())
                 if not queryset:
                     continue
             # FIXME: change to tuple or dict for narrower type
@@ -501,7 +694,7 @@ class Resolver:
 
         # Note: update_local is always off for updates triggered from the resolver
         # but True by default to avoid accidentally skipping updates called by user
-        if update_local and self.has_computedfields(_model):
+        if update_local and _model in self._computed_models:
             # We skip a transaction here in the same sense,
             # as local cf updates are not guarded either.
             queryset = instance if isinstance(instance, QuerySet) \
@@ -557,55 +750,93 @@ class Resolver:
         #       ideally we find a way to avoid it for forward relations
         #       also see #101
         if queryset.query.can_filter() and not queryset.query.distinct_fields:
-            if queryset.query.combinator != "union":
+            # skip distinct for single table queries (no joins), as they cannot contain duplicates
+            # (e.g. internal pk__in filters or single instance updates)
+            if queryset.query.combinator != "union" and len(queryset.query.alias_map) > 1:
                 queryset = queryset.distinct()
         else:
             queryset = model._base_manager.filter(pk__in=subquery_pk(queryset, queryset.db))
 
         # correct update_fields by local mro
-        mro = self.get_local_mro(model, update_fields)
-        fields: Any = set(mro)  # FIXME: narrow type once issue in django-stubs is resolved
+        fields_key = None if update_fields is None else frozenset(update_fields)
+        mro, fields, select, prefetch, reads = self._get_bulk_plan_cached(model, fields_key)
         if update_fields:
             update_fields.update(fields)
 
-        select = self.get_select_related(model, fields)
-        prefetch = self.get_prefetch_related(model, fields)
+        if self._load_depends_only and fields and not queryset.query.combinator:
+            queryset = queryset.only(*reads)
+
         if select:
             queryset = queryset.select_related(*select)
         if prefetch:
             queryset = queryset.prefetch_related(*prefetch)
 
-        pks = []
+        pks: Set[Any] = set()
         if fields:
             q_size = self.get_querysize(model, fields, querysize)
+            funcs = self._get_compute_funcs_cached(model, fields_key)
+            # hot loop locals
+            _getattr = getattr
+            _setattr = setattr
+            _update = self._update
+            batchsize = self._get_batchsize(model._base_manager.db)
             change: List[Model] = []
             for elem in slice_iterator(queryset, q_size):
                 # note on the loop: while it is technically not needed to batch things here,
                 # we still prebatch to not cause memory issues for very big querysets
                 has_changed = False
-                for comp_field in mro:
-                    new_value = self._compute(elem, model, comp_field)
-                    if new_value != getattr(elem, comp_field):
-                        has_changed = True
-                        setattr(elem, comp_field, new_value)
+                elem._cf_ctx = {}  # shared memo for cf_memo
+                try:
+                    for comp_field, func, _ in funcs:
+                        new_value = func(elem)
+                        if new_value != _getattr(elem, comp_field):
+                            has_changed = True
+                            _setattr(elem, comp_field, new_value)
+                finally:
+                    del elem._cf_ctx
                 if has_changed:
                     change.append(elem)
-                    pks.append(elem.pk)
-                if len(change) >= self._batchsize:
-                    self._update(model._base_manager.all(), change, fields)
-                    change = []
+                    pks.add(elem.pk)
+                    if len(change) >= batchsize:
+                        _update(model._base_manager.all(), change, fields)
+                        change = []
             if change:
-                self._update(model._base_manager.all(), change, fields)
+                _update(model._base_manager.all(), change, fields)
 
         # trigger dependent comp field updates from changed records
         # other than before we exit the update tree early, if we have no changes at all
         # also cuts the update tree for recursive deps (tree-like)
         if not local_only and pks:
             self.update_dependent(model._base_manager.filter(pk__in=pks), model, fields, update_local=False)
-        return set(pks) if return_pks else None
+        return pks if return_pks else None
     
+    def _use_copyupdate(self, using: str) -> bool:
+        """
+        Whether ``_update`` writes with `copy_update` to the database `using`.
+        """
+        return self.use_copyupdate and connections[using].vendor == 'postgresql'
+
+    def _get_batchsize(self, using: str) -> int:
+        """
+        Batch size for writes to the database `using`, matching the update method
+        ``_update`` picks for it.
+        """
+        if self.use_fastupdate or self._use_copyupdate(using):
+            return settings.COMPUTEDFIELDS_BATCHSIZE_FAST
+        batchsize = settings.COMPUTEDFIELDS_BATCHSIZE_BULK
+        if batchsize is None:
+            # bulk_update scales well with bigger batches on postgres,
+            # other backends degrade earlier from the growing CASE WHEN statements
+            return 1000 if connections[using].vendor == 'postgresql' else 500
+        return batchsize
+
     def _update(self, queryset: QuerySet, change: Sequence[Any], fields: Sequence[str]) -> Union[int, None]:
         # we can skip batch_size here, as it already was batched in bulk_updater
+        # with the batch size from _get_batchsize
+        if self._use_copyupdate(queryset.db):
+            # imported late, as it needs psycopg on postgres only
+            from fast_update.copy import copy_update
+            return copy_update(queryset, change, fields)
         if self.use_fastupdate:
             return fast_update(queryset, change, fields, None)
         return queryset.model._base_manager.bulk_update(change, fields)
@@ -620,7 +851,22 @@ class Resolver:
         to the database, always use ``compute(fieldname)`` instead.
         """
         field = self._computed_models[model][fieldname]
-        return field._computed['func'](instance)
+        return field._computed.func(instance)
+
+    def _resolve_compute_funcs(
+        self,
+        model: Type[Model],
+        update_fields: Optional[FrozenSet[str]]
+    ) -> Tuple[Tuple[str, Callable[[Model], Any], bool], ...]:
+        """
+        Uncached resolution of the computed field methods for the local `mro`
+        of `update_fields` to save the ``_compute`` dispatch in hot loops. Returns
+        ``(fieldname, func, is_plain)`` tuples (see ``extract_plain_fields``).
+        """
+        computed_fields = self._computed_models[model]
+        plain = self._plain_fields[model]
+        return tuple((fieldname, computed_fields[fieldname]._computed.func, fieldname in plain)
+                     for fieldname in self._get_local_mro_cached(model, update_fields))
 
     def compute(self, instance: Model, fieldname: str) -> Any:
         """
@@ -673,7 +919,7 @@ class Resolver:
             fields = self._computed_models[model].keys()
         select: Set[str] = set()
         for field in fields:
-            select.update(self._computed_models[model][field]._computed['select_related'])
+            select.update(self._computed_models[model][field]._computed.select_related)
         return select
 
     def get_prefetch_related(
@@ -688,7 +934,7 @@ class Resolver:
             fields = self._computed_models[model].keys()
         prefetch: List[Any] = []
         for field in fields:
-            prefetch.extend(self._computed_models[model][field]._computed['prefetch_related'])
+            prefetch.extend(self._computed_models[model][field]._computed.prefetch_related)
         return prefetch
 
     def get_querysize(
@@ -700,7 +946,7 @@ class Resolver:
         base = settings.COMPUTEDFIELDS_QUERYSIZE if override is None else override
         if fields is None:
             fields = self._computed_models[model].keys()
-        return min(self._computed_models[model][f]._computed['querysize'] or base for f in fields)
+        return min(self._computed_models[model][f]._computed.querysize or base for f in fields)
 
     def get_contributing_fks(self) -> IFkMap:
         """
@@ -786,13 +1032,13 @@ class Resolver:
         """
         self._sanity_check(field, depends or [])
         cf = cast('IComputedField[_ST, _GT]', field)
-        cf._computed = {
-            'func': compute,
-            'depends': depends or [],
-            'select_related': select_related or [],
-            'prefetch_related': prefetch_related or [],
-            'querysize': querysize
-        }
+        cf._computed = ComputedData(
+            compute,
+            tuple(depends) if depends else (),
+            tuple(select_related) if select_related else (),
+            tuple(prefetch_related) if prefetch_related else (),
+            querysize
+        )
         cf.editable = False
         self.add_field(cf)
         return field
@@ -889,14 +1135,6 @@ class Resolver:
             - mode local dependency graphs: ``active_resolver._graph.modelgraphs[your_model]``
             - union graph: ``active_resolver._graph.get_uniongraph()``
 
-            Note that there is not graph object, when running with ``COMPUTEDFIELDS_MAP = True``.
-            In that case either comment out that line `settings.py` and restart the server
-            or build the graph at runtime with:
-
-                >>> from computedfields.graph import ComputedModelsGraph
-                >>> from computedfields.resolver import active_resolver
-                >>> graph = ComputedModelsGraph(active_resolver.computed_models)
-
             Also see the graph documentation :ref:`here<graph>`.
         """
         def wrap(func: Callable[..., _ST]) -> 'Field[_ST, _GT]':
@@ -941,10 +1179,14 @@ class Resolver:
         else:
             skip = dkwargs.get('skip_after', False)
         
+        update_computedfields = self.update_computedfields
+
         def wrap(func: F) -> F:
             def _save(instance, *args, **kwargs):
-                new_fields = self.update_computedfields(instance, kwargs.get('update_fields'))
-                if new_fields:
+                update_fields = kwargs.get('update_fields')
+                new_fields = update_computedfields(instance, update_fields)
+                # only rewrite kwargs, if the resolver expanded update_fields
+                if new_fields is not None and new_fields is not update_fields:
                     kwargs['update_fields'] = new_fields
                 kwargs['skip_computedfields'] = skip
                 return func(instance, *args, **kwargs)
@@ -966,19 +1208,74 @@ class Resolver:
         Returns ``None`` or an updated set of field names for `update_fields`.
         The returned fields might contained additional computed fields, that also
         changed based on the input fields, thus should extend `update_fields`
-        on a save call.
+        on a save call. The set is returned as cached frozenset and cannot be altered.
         """
         model = type(instance)
-        if not self.has_computedfields(model):
+        if model not in self._computed_models:
             return update_fields
-        cf_mro = self.get_local_mro(model, update_fields)
-        if update_fields:
-            update_fields = set(update_fields)
-            update_fields.update(set(cf_mro))
-        for fieldname in cf_mro:
-            setattr(instance, fieldname, self._compute(instance, model, fieldname))
-        if update_fields:
+        fields_key = None if update_fields is None else frozenset(update_fields)
+        data = instance.__dict__
+        _setattr = setattr
+        instance._cf_ctx = {}  # shared memo for cf_memo
+        try:
+            for fieldname, func, is_plain in self._get_compute_funcs_cached(model, fields_key):
+                if is_plain:
+                    data[fieldname] = func(instance)
+                else:
+                    _setattr(instance, fieldname, func(instance))
+        finally:
+            del instance._cf_ctx
+        if fields_key:
+            return self._get_update_fields_cached(model, fields_key)
+        return None
+
+    def update_computedfields_bulk(
+        self,
+        instances: Sequence[Model],
+        update_fields: Optional[Iterable[str]] = None
+    ) -> Optional[Iterable[str]]:
+        """
+        Update values of local computed fields of multiple `instances` of the same model.
+
+        Other than calling ``update_computedfields`` for every single instance,
+        the local `MRO` and the computed field methods are resolved only once,
+        and `select_related` rules of the computed fields are pulled with one query per relation
+        for all instances. This makes it a good fit for a follow-up ``bulk_update``:
+
+            >>> fields = update_computedfields_bulk(objs, ['name'])
+            >>> MyComputedModel.objects.bulk_update(objs, fields)
+
+        Returns ``None`` or an updated set of field names for `update_fields`
+        (see ``update_computedfields``).
+        """
+        if not instances:
             return update_fields
+        model = type(instances[0])
+        if model not in self._computed_models:
+            return update_fields
+        fields_key = None if update_fields is None else frozenset(update_fields)
+        cf_mro = self._get_local_mro_cached(model, fields_key)
+        funcs = self._get_compute_funcs_cached(model, fields_key)
+
+        # pull select_related relations once for all instances
+        # note: prefetch_related_objects respects current fk values and already cached relations
+        select = self.get_select_related(model, cf_mro)
+        if select:
+            prefetch_related_objects(instances, *select)
+
+        for instance in instances:
+            data = instance.__dict__
+            instance._cf_ctx = {}  # shared memo for cf_memo
+            try:
+                for fieldname, func, is_plain in funcs:
+                    if is_plain:
+                        data[fieldname] = func(instance)
+                    else:
+                        setattr(instance, fieldname, func(instance))
+            finally:
+                del instance._cf_ctx
+        if fields_key:
+            return self._get_update_fields_cached(model, fields_key)
         return None
 
     def has_computedfields(self, model: Type[Model]) -> bool:
@@ -997,7 +1294,8 @@ class Resolver:
         """
         Indicate whether `fieldname` on `model` is a computed field.
         """
-        return fieldname in self.get_computedfields(model)
+        fields = self._computed_models.get(model)
+        return fields is not None and fieldname in fields
 
     def get_graphs(self) -> Tuple[Graph, Dict[Type[Model], ModelGraph], Graph]:
         """
@@ -1006,9 +1304,13 @@ class Resolver:
         """
         graph = self._graph
         if not graph:
-            graph = ComputedModelsGraph(active_resolver.computed_models)
+            # graph was reset or not built yet - keep the new one for later calls,
+            # but only if it belongs to loaded maps (load_maps replaces it anyway)
+            graph = ComputedModelsGraph(self.computed_models)
             graph.get_edgepaths()
             graph.get_uniongraph()
+            if self._map_loaded:
+                self._graph = graph
         return (graph, graph.modelgraphs, graph.get_uniongraph())
 
 
@@ -1,4 +1,5 @@
 from typing import Any
+from django.core.signals import setting_changed
 
 
 # global app defaults
@@ -9,15 +10,21 @@ DEFAULTS = {
     # whether to allow intermodel field recursions
     'COMPUTEDFIELDS_ALLOW_RECURSION': False,
 
-    # batchsize for bulk_update
-    'COMPUTEDFIELDS_BATCHSIZE_BULK': 100,
+    # batchsize for bulk_update (None: backend dependent, see Resolver._get_batchsize)
+    'COMPUTEDFIELDS_BATCHSIZE_BULK': None,
 
     # batchsize for fast_update
     'COMPUTEDFIELDS_BATCHSIZE_FAST': 10000,
 
+    # whether to use copy_update on postgres (takes precedence over fast_update)
+    'COMPUTEDFIELDS_COPYUPDATE': False,
+
     # whether to use fast_update
     'COMPUTEDFIELDS_FASTUPDATE': False,
 
+    # whether bulk updates should only load local fields listed in depends
+    'COMPUTEDFIELDS_LOAD_DEPENDS_ONLY': False,
+
     # batchsize of select queries done by resolver
     'COMPUTEDFIELDS_QUERYSIZE': 10000
 }
@@ -26,13 +33,38 @@ DEFAULTS = {
 class DefaultsProxy:
     """
     Defaults proxy to allow runtime overrides from settings.py.
+
+    Resolved values are cached in slots of the known settings, changes via
+    ``setting_changed`` (e.g. ``override_settings`` in tests) invalidate the cached value.
     """
+    __slots__ = ('defaults',) + tuple(DEFAULTS)
+
     def __init__(self, defaults):
         self.defaults = defaults
 
     def __getattr__(self, key) -> Any:
+        # only called for unset slots
         from django.conf import settings
-        return getattr(settings, key, self.defaults[key])
+        value = getattr(settings, key, self.defaults[key])
+        object.__setattr__(self, key, value)
+        return value
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop the cached value of `key`.
+        """
+        try:
+            object.__delattr__(self, key)
+        except AttributeError:
+            pass
 
 
 settings = DefaultsProxy(DEFAULTS)
+
+
+def _setting_changed(setting: str, **kwargs) -> None:
+    if setting in DEFAULTS:
+        settings.invalidate(setting)
+
+
+setting_changed.connect(_setting_changed)
@@ -82,42 +82,42 @@ class SelfRef(ComputedFieldsModel):
         depends=[('self', ['c1'])]
     )
     def c2(self) -> str:
-        return 'c2' + self.c1
+        return f'c2{self.c1}'
 
     @computed(
         cast('models.CharField[str, str]', models.CharField(max_length=32, default='')),
         depends=[('self', ['c1'])]
     )
     def c3(self) -> str:
-        return 'c3' + self.c1
+        return f'c3{self.c1}'
 
     @computed(
         cast('models.CharField[str, str]', models.CharField(max_length=32, default='')),
         depends=[('self', ['c3'])]
     )
     def c4(self) -> str:
-        return 'c4' + self.c3
+        return f'c4{self.c3}'
 
     @computed(
         cast('models.CharField[str, str]', models.CharField(max_length=32, default='')),
         depends=[('self', ['c2', 'c4', 'c6'])]
     )
     def c5(self) -> str:
-        return 'c5' + self.c2 + self.c4 + self.c6
+        return f'c5{self.c2}{self.c4}{self.c6}'
 
     @computed(
         cast('models.CharField[str, str]', models.CharField(max_length=32, default='')),
         depends=[('self', ['xy'])]
     )
     def c6(self) -> str:
-        return 'c6' + str(self.xy)
+        return f'c6{self.xy}'
 
     @computed(
         cast('models.CharField[str, str]', models.CharField(max_length=32, default='')),
         depends=[('self', ['c8'])]
     )
     def c7(self) -> str:
-        return 'c7' + self.c8
+        return f'c7{self.c8}'
 
     @computed(
         cast('models.CharField[str, str]', models.CharField(max_length=32, default='')),
@@ -1,21 +1,41 @@
+from unittest import mock
 from django.test import TestCase
 from django.contrib.admin.sites import AdminSite
 from computedfields.models import ComputedFieldsAdminModel, active_resolver, ContributingModelsModel
 from computedfields.admin import ComputedModelsAdmin, ContributingModelsAdmin
+from computedfields.graph import ComputedModelsGraph
 from .models import Foo, Bar, Baz, SelfRef
 
 
+_MAPS_LOADED = False
+
+def _ensure_maps():
+    # recreate the resolver maps only once for all test classes of this module
+    global _MAPS_LOADED
+    if not _MAPS_LOADED:
+        active_resolver.load_maps(_force_recreation=True)
+        _MAPS_LOADED = True
+
+
 class TestModels(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        _ensure_maps()
+
     def setUp(self):
-        active_resolver.load_maps(_force_recreation=True)
         self.foo = Foo.objects.create(name='foo1')
         self.bar = Bar.objects.create(name='bar1', foo=self.foo)
         self.baz = Baz.objects.create(name='baz1', bar=self.bar)
 
+    def _reload(self):
+        # reload all three records with a single joined query
+        self.baz = Baz.objects.select_related('bar__foo').get(pk=self.baz.pk)
+        self.bar = self.baz.bar
+        self.foo = self.bar.foo
+
     def test_create(self):
-        self.foo.refresh_from_db()
-        self.bar.refresh_from_db()
-        self.baz.refresh_from_db()
+        self._reload()
         self.assertEqual(self.foo.bazzes, 'baz1')
         self.assertEqual(self.bar.foo_bar, 'foo1bar1')
         self.assertEqual(self.baz.foo_bar_baz, 'foo1bar1baz1')
@@ -27,15 +47,19 @@ class TestModels(TestCase):
 
     def test_delete_bar(self):
         self.baz.delete()
-        self.foo.refresh_from_db()
-        self.bar.refresh_from_db()
+        self.bar = Bar.objects.select_related('foo').get(pk=self.bar.pk)
+        self.foo = self.bar.foo
         self.assertEqual(self.foo.bazzes, '')
         self.assertEqual(self.bar.foo_bar, 'foo1bar1')
 
 
 class TestModelClassesForAdmin(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        _ensure_maps()
+
     def setUp(self):
-        active_resolver.load_maps(_force_recreation=True)
         self.site = AdminSite()
         self.adminobj = ComputedModelsAdmin(ComputedFieldsAdminModel, self.site)
         self.adminobj_contributing = ContributingModelsAdmin(ContributingModelsModel, self.site)
@@ -80,6 +104,24 @@ class TestModelClassesForAdmin(TestCase):
             self.adminobj_contributing.fk_fields(instance)
             self.adminobj_contributing.name(instance)
 
+    def test_adminclasses_reuse_graph(self):
+        # graph views use the graph from load_maps without building a new one
+        with mock.patch('computedfields.resolver.ComputedModelsGraph', wraps=ComputedModelsGraph) as graph_cls:
+            for instance in ComputedFieldsAdminModel.objects.all():
+                self.adminobj.render_modelgraph({}, instance.pk)
+            self.adminobj.render_graph({})
+            self.adminobj.render_uniongraph({})
+        self.assertEqual(graph_cls.call_count, 0)
+
+        # a reset graph gets rebuilt once and shared by all later views
+        active_resolver._graph = None
+        with mock.patch('computedfields.resolver.ComputedModelsGraph', wraps=ComputedModelsGraph) as graph_cls:
+            for instance in ComputedFieldsAdminModel.objects.all():
+                self.adminobj.render_modelgraph({}, instance.pk)
+            self.adminobj.render_graph({})
+            self.adminobj.render_uniongraph({})
+        self.assertEqual(graph_cls.call_count, 1)
+
 
 from computedfields.models import update_dependent
 from time import time
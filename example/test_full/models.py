@@ -1,6 +1,14 @@
 from django.db import models
 import sys
-from computedfields.models import ComputedFieldsModel, computed, precomputed, ComputedField
+from computedfields.models import ComputedFieldsModel, computed, precomputed, ComputedField, cf_memo
+
+
+def _name(self):
+    return self.name
+
+
+def _empty_comp(self):
+    return ''
 
 
 def model_factory(name, keys):
@@ -25,7 +33,7 @@ def model_factory(name, keys):
     # add module and __unicode__ attr
     attrs.update({
         '__module__': 'test_full.models',
-        '__unicode__': lambda self: self.name})
+        '__unicode__': _name})
 
     # name field
     attrs.update({'name': models.CharField(max_length=5)})
@@ -42,7 +50,7 @@ def model_factory(name, keys):
             key, related_name=bwd_name+'_o', blank=True, null=True, on_delete=models.SET_NULL)
 
     # comp field
-    attrs['comp'] = computed(models.CharField(max_length=20), depends=[])(lambda self: '')
+    attrs['comp'] = computed(models.CharField(max_length=20), depends=[])(_empty_comp)
 
     # needs reset in tests
     attrs['needs_reset'] = True
@@ -77,14 +85,17 @@ class NoRelatedA(ComputedFieldsModel):
         res = [self.name]
         if not self.pk:
             return '#'.join(res)
-        for b in self.norelatedb_set.all():
+        # fetch c and d records in one go instead of querying per b and c
+        for b in self.norelatedb_set.prefetch_related(models.Prefetch(
+                'norelatedc_set', queryset=NoRelatedC.objects.select_related('norelatedd'))):
             res.append(b.name)
             for c in b.norelatedc_set.all():
                 res.append(c.name)
-                try:
-                    res.append(c.norelatedd.comp)
-                except models.ObjectDoesNotExist:
-                    pass
+                # a missing reverse o2o still raises RelatedObjectDoesNotExist (an AttributeError),
+                # getattr with a default just swallows it, there is no real sentinel
+                d = getattr(c, 'norelatedd', None)
+                if d is not None:
+                    res.append(d.comp)
         return '#'.join(res)
 
 
@@ -104,6 +115,8 @@ class NoRelatedD(ComputedFieldsModel):
 
     @computed(models.CharField(max_length=32), depends=[('o_dc.m_cb.f_ba', ['name'])])
     def comp(self):
+        if self.o_dc_id is None:
+            return self.name + '-a:'
         inner = []
         try:
             for b in self.o_dc.m_cb.all():
@@ -130,19 +143,19 @@ class MultipleCompRef(ComputedFieldsModel):
     a = models.ForeignKey(MultipleCompSource, related_name='a_set', on_delete=models.CASCADE)
     b = models.ForeignKey(MultipleCompSource, related_name='b_set', on_delete=models.CASCADE)
 
-    @computed(models.CharField(max_length=32), depends=[('a', ['upper'])])
+    @computed(models.CharField(max_length=32), depends=[('a', ['upper'])], select_related=['a'])
     def upper_a(self):
         return self.a.upper
 
-    @computed(models.CharField(max_length=32), depends=[('a', ['lower'])])
+    @computed(models.CharField(max_length=32), depends=[('a', ['lower'])], select_related=['a'])
     def lower_a(self):
         return self.a.lower
 
-    @computed(models.CharField(max_length=32), depends=[('b', ['upper'])])
+    @computed(models.CharField(max_length=32), depends=[('b', ['upper'])], select_related=['b'])
     def upper_b(self):
         return self.b.upper
 
-    @computed(models.CharField(max_length=32), depends=[('b', ['lower'])])
+    @computed(models.CharField(max_length=32), depends=[('b', ['lower'])], select_related=['b'])
     def lower_b(self):
         return self.b.lower
 
@@ -156,7 +169,8 @@ class PartialUpdateB(ComputedFieldsModel):
     f_ba = models.ForeignKey(PartialUpdateA, related_name='a_set', on_delete=models.CASCADE)
     name = models.CharField(max_length=32)
 
-    @computed(models.CharField(max_length=32), depends=[('f_ba', ['name']), ('self', ['name'])])
+    @computed(models.CharField(max_length=32), depends=[('f_ba', ['name']), ('self', ['name'])],
+        select_related=['f_ba'])
     def comp(self):
         return self.f_ba.name + self.name
 
@@ -171,20 +185,15 @@ class Parent(ComputedFieldsModel):
 
     @computed(models.IntegerField(default=0), depends=[('children.subchildren', ['subparent'])])
     def subchildren_count(self):
-        count = 0
         if not self.pk:
-            return count
-        for child in self.children.all():
-            count += child.subchildren.all().count()
-        return count
+            return 0
+        return Subchild.objects.filter(subparent__parent=self).count()
 
     @computed(models.IntegerField(default=0), depends=[('children', ['subchildren_count'])])
     def subchildren_count_proxy(self):
-        from functools import reduce
-        from operator import add
         if not self.pk:
             return 0
-        return reduce(add, (el.subchildren_count for el in self.children.all()), 0)
+        return self.children.aggregate(s=models.Sum('subchildren_count'))['s'] or 0
 
 class Child(ComputedFieldsModel):
     parent = models.ForeignKey(Parent, related_name='children', on_delete=models.CASCADE)
@@ -215,26 +224,24 @@ class XChild(models.Model):
 class DepBaseA(ComputedFieldsModel):
     @computed(models.CharField(max_length=256), depends=[('sub1.sub2.subfinal', ['name'])])
     def final_proxy(self):
-        s = ''
         if not self.pk:
-            return s
-        for s1 in self.sub1.all().order_by('pk'):
-            for s2 in s1.sub2.all().order_by('pk'):
-                for sf in s2.subfinal.all().order_by('pk'):
-                    s += sf.name
-        return s
+            return ''
+        # single joined query, ordered like the nested sub1 -> sub2 -> subfinal walk
+        return ''.join(DepSubFinal.objects
+            .filter(sub2__sub1__a=self)
+            .order_by('sub2__sub1__pk', 'sub2__pk', 'pk')
+            .values_list('name', flat=True))
 
 class DepBaseB(ComputedFieldsModel):
     @computed(models.CharField(max_length=256), depends=[('sub1.sub2.subfinal', ['name'])])
     def final_proxy(self):
-        s = ''
         if not self.pk:
-            return s
-        for s1 in self.sub1.all().order_by('pk'):
-            for s2 in s1.sub2.all().order_by('pk'):
-                for sf in s2.subfinal.all().order_by('pk'):
-                    s += sf.name
-        return s
+            return ''
+        # single joined query, ordered like the nested sub1 -> sub2 -> subfinal walk
+        return ''.join(DepSubFinal.objects
+            .filter(sub2__sub1__b=self)
+            .order_by('sub2__sub1__pk', 'sub2__pk', 'pk')
+            .values_list('name', flat=True))
 
 class DepSub1(models.Model):
     a = models.ForeignKey(DepBaseA, related_name='sub1', on_delete=models.CASCADE)
@@ -278,20 +285,15 @@ class ParentOfAbstract(ComputedFieldsModel):
 
     @computed(models.IntegerField(default=0), depends=[('children.subchildren', ['subparent'])])
     def subchildren_count(self):
-        count = 0
         if not self.pk:
-            return count
-        for child in self.children.all():
-            count += child.subchildren.all().count()
-        return count
+            return 0
+        return ConcreteSubchild.objects.filter(subparent__parent=self).count()
 
     @computed(models.IntegerField(default=0), depends=[('children', ['subchildren_count'])])
     def subchildren_count_proxy(self):
-        from functools import reduce
-        from operator import add
         if not self.pk:
             return 0
-        return reduce(add, (el.subchildren_count for el in self.children.all()), 0)
+        return self.children.aggregate(s=models.Sum('subchildren_count'))['s'] or 0
 
 
 class AbstractChild(ComputedFieldsModel):
@@ -1107,3 +1109,44 @@ class HaTagProxy(HaTag):
 class HaProxy(Ha):
     class Meta:
         proxy = True
+
+
+# shared intermediate results with cf_memo
+MEMO_CALLS = []
+
+class SharedMemo(ComputedFieldsModel):
+    name = models.CharField(max_length=32)
+
+    def expensive(self):
+        MEMO_CALLS.append(self.name)
+        return self.name.upper()
+
+    @computed(models.CharField(max_length=33), depends=[('self', ['name'])])
+    def a(self):
+        return 'a' + cf_memo(self, 'expensive', self.expensive)
+
+    @computed(models.CharField(max_length=33), depends=[('self', ['name'])])
+    def b(self):
+        return 'b' + cf_memo(self, 'expensive', self.expensive)
+
+
+# dependent paths of different length (combined by union)
+class UnionA(models.Model):
+    name = models.CharField(max_length=32)
+    notes = models.TextField(default='')
+
+class UnionB(models.Model):
+    a = models.ForeignKey(UnionA, on_delete=models.CASCADE)
+
+class UnionC(ComputedFieldsModel):
+    a = models.ForeignKey(UnionA, related_name='c_direct', on_delete=models.CASCADE)
+    b = models.ForeignKey(UnionB, on_delete=models.CASCADE)
+    notes = models.TextField(default='')
+
+    @computed(
+        models.CharField(max_length=65),
+        depends=[('a', ['name']), ('b.a', ['name'])],
+        select_related=['a', 'b__a']
+    )
+    def names(self):
+        return self.a.name + '$' + self.b.a.name
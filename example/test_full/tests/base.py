@@ -22,9 +22,9 @@ class GenericModelTestBase(TestCase):
         models = active_resolver.computed_models
         for modelname, data in mapping.items():
             if data.get('depends'):
-                models[MODELS[modelname]]['comp']._computed['depends'] = data.get('depends')
+                models[MODELS[modelname]]['comp']._computed.depends = data.get('depends')
             if data.get('func'):
-                models[MODELS[modelname]]['comp']._computed['func'] = data.get('func')
+                models[MODELS[modelname]]['comp']._computed.func = data.get('func')
         active_resolver.load_maps(_force_recreation=True)
         self.graph = active_resolver._graph
 
@@ -37,7 +37,9 @@ class GenericModelTestBase(TestCase):
         for model in models:
             if not hasattr(model, 'needs_reset'):
                 continue
-            models[model]['comp']._computed['depends'] = {}
+            models[model]['comp']._computed.depends = {}
             for fieldname, f in models[model].items():
-                f._computed['func'] = lambda x: ''
+                f._computed.func = lambda x: ''
+        # swapped funcs must not be served from the resolver cache
+        active_resolver._get_compute_funcs_cached.cache_clear()
         self.graph = None
@@ -1,12 +1,18 @@
 from .base import GenericModelTestBase
+from ..models import SelfA
 from computedfields.models import active_resolver
 from computedfields.graph import CycleEdgeException
 from django.core.management import call_command
 from django.core.management.base import CommandError
+from django.db import connections
+from django.test import TestCase
+from contextlib import redirect_stdout
 from io import StringIO
+from types import ModuleType
+from unittest import mock
 import pickle
-from django.conf import settings
 import os
+import sys
 
 
 def strip_proxy_models(map_data):
@@ -42,12 +48,15 @@ class CommandTests(GenericModelTestBase):
 
     def tearDown(self):
         self.resetDeps()
+        # rendergraph leaves the dot source next to the rendered file
+        for filename in ('output', 'output.pdf'):
+            if os.path.exists(filename):
+                os.remove(filename)
 
     def test_rendergraph(self):
         # TODO: test for output
         self.assertEqual(self.graph.is_cyclefree, True)
         call_command('rendergraph', 'output', verbosity=0)
-        os.remove('output.pdf')
 
     def test_rendergraph_with_cycle(self):
         import sys
@@ -62,21 +71,64 @@ class CommandTests(GenericModelTestBase):
         )
 
         # does not raise anymore with COMPUTEDFIELDS_ALLOW_RECURSION
-        setattr(settings, 'COMPUTEDFIELDS_ALLOW_RECURSION', True)
-        self.setDeps({
-            'A': {'depends': [('f_ag', ['comp'])]},
-            'G': {'depends': [('f_ga', ['comp'])]},
-        })
-        self.assertEqual(active_resolver._graph.is_cyclefree, False)
-        stdout = sys.stdout
-        sys.stdout = StringIO()
-        call_command('rendergraph', 'output', verbosity=0)
-        # should have printed cycle info on stdout
-        self.assertIn('Warning -  1 cycles in dependencies found:', sys.stdout.getvalue())
-        sys.stdout = stdout
-        setattr(settings, 'COMPUTEDFIELDS_ALLOW_RECURSION', False)
+        with self.settings(COMPUTEDFIELDS_ALLOW_RECURSION=True):
+            self.setDeps({
+                'A': {'depends': [('f_ag', ['comp'])]},
+                'G': {'depends': [('f_ga', ['comp'])]},
+            })
+            self.assertEqual(active_resolver._graph.is_cyclefree, False)
+            stdout = sys.stdout
+            sys.stdout = StringIO()
+            call_command('rendergraph', 'output', verbosity=0)
+            # should have printed cycle info on stdout
+            self.assertIn('Warning -  1 cycles in dependencies found:', sys.stdout.getvalue())
+            sys.stdout = stdout
 
     def test_updatedata(self):
         # TODO: advanced test case
         self.models.A(name='a').save()
         call_command('updatedata', verbosity=0)
+
+
+@mock.patch.object(active_resolver, 'use_fastupdate', False)
+@mock.patch.object(active_resolver, 'use_copyupdate', True)
+class UpdatedataModeTests(TestCase):
+    def setUp(self):
+        SelfA.objects.create(name='a')
+        SelfA.objects.all().update(c1='desync')
+        self.copy_update = mock.Mock(return_value=1)
+        copy_module = ModuleType('fast_update.copy')
+        copy_module.copy_update = self.copy_update
+        # fast_update.copy needs psycopg, provide the mocked function directly
+        for patcher in (
+            mock.patch.dict(sys.modules, {'fast_update.copy': copy_module}),
+            mock.patch.object(connections['default'], 'vendor', 'postgresql')
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def updatedata(self, *args):
+        out = StringIO()
+        with redirect_stdout(out):
+            call_command('updatedata', 'test_full.SelfA', *args)
+        return out.getvalue()
+
+    def test_default_reports_copy(self):
+        self.assertIn('Update mode: settings.py --> copy', self.updatedata())
+        self.copy_update.assert_called_once()
+
+    def test_bulk_skips_copy(self):
+        self.assertIn('Update mode: bulk', self.updatedata('--mode', 'bulk'))
+        self.copy_update.assert_not_called()
+        self.assertFalse(active_resolver.use_copyupdate)
+        self.assertEqual(SelfA.objects.get().c1, 'c1a')
+
+    def test_fast_skips_copy(self):
+        with mock.patch('computedfields.resolver.fast_update') as fast_update:
+            self.assertIn('Update mode: fast', self.updatedata('--mode', 'fast'))
+        self.copy_update.assert_not_called()
+        fast_update.assert_called_once()
+
+    def test_copy(self):
+        self.assertIn('Update mode: copy', self.updatedata('--mode', 'copy'))
+        self.copy_update.assert_called_once()
@@ -1,6 +1,11 @@
+import sys
+from types import ModuleType
+from unittest import mock
+from django.db import connections
+from django.db.models import QuerySet
 from django.test import TestCase
-from ..models import ComputeLocal, LocalBulkUpdate
-from computedfields.models import update_dependent
+from ..models import ComputeLocal, LocalBulkUpdate, SelfA
+from computedfields.models import update_dependent, update_computedfields_bulk, active_resolver
 
 class UpdateDependentWithLocals(TestCase):
     def setUp(self):
@@ -24,3 +29,66 @@ class UpdateDependentWithLocals(TestCase):
         self.assertEqual(self.cl.c7, 'c7c8')
         self.assertEqual(self.cl.c8, 'c8')
         self.assertEqual(self.bu.same_as_fk_c5, 'c5c2OTHERc4c3OTHERc6123')
+
+
+class UpdateComputedfieldsBulk(TestCase):
+    def setUp(self):
+        self.objs = [SelfA.objects.create(name='a'), SelfA.objects.create(name='b')]
+
+    def test_bulk_update(self):
+        for obj in self.objs:
+            obj.name += 'x'
+        fields = update_computedfields_bulk(self.objs, ['name'])
+        self.assertEqual(fields, {'name', 'c1', 'c2', 'c3', 'c4'})
+        SelfA.objects.bulk_update(self.objs, fields)
+        self.assertEqual(
+            list(SelfA.objects.all().order_by('pk').values_list('c4', flat=True)),
+            ['c4c1axc3c2c1ax', 'c4c1bxc3c2c1bx']
+        )
+
+    def test_empty(self):
+        self.assertEqual(update_computedfields_bulk([], ['name']), ['name'])
+
+
+@mock.patch.object(active_resolver, 'use_fastupdate', False)
+@mock.patch.object(active_resolver, 'use_copyupdate', True)
+class CopyUpdate(TestCase):
+    def setUp(self):
+        for name in 'abc':
+            SelfA.objects.create(name=name)
+        SelfA.objects.all().update(name='x')
+        self.copy_update = mock.Mock(return_value=3)
+        copy_module = ModuleType('fast_update.copy')
+        copy_module.copy_update = self.copy_update
+        # fast_update.copy needs psycopg, provide the mocked function directly
+        patcher = mock.patch.dict(sys.modules, {'fast_update.copy': copy_module})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_postgres_uses_copyupdate(self):
+        with mock.patch.object(connections['default'], 'vendor', 'postgresql'), \
+                self.settings(COMPUTEDFIELDS_BATCHSIZE_FAST=10, COMPUTEDFIELDS_BATCHSIZE_BULK=1):
+            active_resolver.bulk_updater(SelfA.objects.all(), None)
+        self.copy_update.assert_called_once()
+        queryset, change, fields = self.copy_update.call_args.args
+        self.assertEqual(queryset.model, SelfA)
+        self.assertEqual(len(change), 3)
+        self.assertEqual(set(fields), {'c1', 'c2', 'c3', 'c4'})
+
+    def test_fallback_bulkupdate(self):
+        with mock.patch.object(QuerySet, 'bulk_update', autospec=True,
+                               side_effect=QuerySet.bulk_update) as bulk_update, \
+                self.settings(COMPUTEDFIELDS_BATCHSIZE_FAST=10, COMPUTEDFIELDS_BATCHSIZE_BULK=1):
+            active_resolver.bulk_updater(SelfA.objects.all(), None)
+        self.copy_update.assert_not_called()
+        # one record per write with the bulk batch size
+        self.assertEqual(bulk_update.call_count, 3)
+        self.assertEqual(list(SelfA.objects.values_list('c1', flat=True)), ['c1x', 'c1x', 'c1x'])
+
+    def test_fallback_fastupdate(self):
+        with mock.patch.object(active_resolver, 'use_fastupdate', True), \
+                mock.patch('computedfields.resolver.fast_update') as fast_update, \
+                self.settings(COMPUTEDFIELDS_BATCHSIZE_FAST=2, COMPUTEDFIELDS_BATCHSIZE_BULK=1):
+            active_resolver.bulk_updater(SelfA.objects.all(), None)
+        self.copy_update.assert_not_called()
+        self.assertEqual([len(c.args[1]) for c in fast_update.call_args_list], [2, 1])
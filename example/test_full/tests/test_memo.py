@@ -0,0 +1,42 @@
+from unittest import mock
+from django.test import TestCase
+from ..models import SharedMemo, MEMO_CALLS
+from computedfields.models import update_dependent, compute
+from computedfields.resolver import Resolver
+
+
+class TestCfMemo(TestCase):
+    def setUp(self):
+        MEMO_CALLS.clear()
+        self.obj = SharedMemo.objects.create(name='x')
+
+    def test_save(self):
+        self.assertEqual(self.obj.a, 'aX')
+        self.assertEqual(self.obj.b, 'bX')
+        self.assertEqual(MEMO_CALLS, ['x'])
+        # no stale memo on next save
+        self.obj.name = 'y'
+        self.obj.save()
+        self.assertEqual(self.obj.a, 'aY')
+        self.assertEqual(self.obj.b, 'bY')
+        self.assertEqual(MEMO_CALLS, ['x', 'y'])
+
+    def test_bulk(self):
+        SharedMemo.objects.all().update(name='z')
+        update_dependent(SharedMemo.objects.all())
+        self.obj.refresh_from_db()
+        self.assertEqual(self.obj.a, 'aZ')
+        self.assertEqual(self.obj.b, 'bZ')
+        self.assertEqual(MEMO_CALLS, ['x', 'z'])
+
+    def test_bulk_cleanup(self):
+        SharedMemo.objects.all().update(name='z')
+        with mock.patch.object(Resolver, '_update', autospec=True, side_effect=Resolver._update) as update:
+            update_dependent(SharedMemo.objects.all())
+        # written records carry no memo
+        for elem in update.call_args.args[2]:
+            self.assertFalse(hasattr(elem, '_cf_ctx'))
+
+    def test_compute(self):
+        self.assertEqual(compute(self.obj, 'b'), 'bX')
+        self.assertEqual(MEMO_CALLS, ['x', 'x'])
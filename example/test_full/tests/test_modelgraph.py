@@ -1,5 +1,5 @@
 from django.test import TestCase
-from computedfields.graph import ModelGraph, Edge, Node
+from computedfields.graph import ModelGraph, Edge, Node, CycleEdgeException
 from computedfields.models import active_resolver
 from ..models import SelfA, SelfB
 
@@ -44,6 +44,26 @@ class TestModelGraph(TestCase):
         # after  '##' has only one edge to c1
         self.assertEqual([edge for edge in self.ga.edges if edge.left == Node('##')], [Edge(Node('##'), Node('c1'))])
 
+    def assertCycle(self, edges, nodes):
+        # edges form a closed chain over exactly the given nodes
+        self.assertEqual(set(edge.left for edge in edges), set(Node(n) for n in nodes))
+        for edge, next_edge in zip(edges, edges[1:] + edges[:1]):
+            self.assertIs(edge.right, next_edge.left)
+
+    def test_transitive_reduction_cycle(self):
+        graph = ModelGraph(SelfA, {'c1': {'c2'}, 'c2': {'c1'}}, {})
+        self.assertRaises(CycleEdgeException, graph.transitive_reduction)
+        graph = ModelGraph(SelfA, {'c1': {'c3'}, 'c2': {'c1'}, 'c3': {'c2'}, 'c4': {'c1'}}, {})
+        with self.assertRaises(CycleEdgeException) as cm:
+            graph.transitive_reduction()
+        self.assertCycle(cm.exception.args[0], ['c1', 'c2', 'c3'])
+
+    def test_topological_paths_cycle(self):
+        graph = ModelGraph(SelfA, {'c1': {'c3'}, 'c2': {'c1'}, 'c3': {'c2'}, 'c4': {'c1'}}, {})
+        with self.assertRaises(CycleEdgeException) as cm:
+            graph.get_topological_paths()
+        self.assertCycle(cm.exception.args[0], ['c1', 'c2', 'c3'])
+
     def test_topological_paths(self):
         paths = self.ga.get_topological_paths()
         # should contain all cfs as self dep
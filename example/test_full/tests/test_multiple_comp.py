@@ -1,4 +1,7 @@
 from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from computedfields.models import active_resolver
 from .. import models
 
 
@@ -38,3 +41,14 @@ class TestMultipleComp(TestCase):
         self.assertEqual(self.ref.lower_a, 'sourcechanged')
         self.assertEqual(self.ref.upper_b, 'SOURCECHANGED')
         self.assertEqual(self.ref.lower_b, 'sourcechanged')
+
+    def test_bulk_recompute_single_select(self):
+        models.MultipleCompSource.objects.filter(pk=self.source.pk).update(upper='X', lower='x')
+        with CaptureQueriesContext(connection) as queries:
+            active_resolver.bulk_updater(models.MultipleCompRef.objects.all(), None)
+        # a and b are joined into the record query, no lazy loads per field
+        selects = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('SELECT')]
+        self.assertEqual(len(selects), 1)
+        self.ref.refresh_from_db()
+        self.assertEqual(self.ref.upper_a, 'X')
+        self.assertEqual(self.ref.lower_b, 'x')
@@ -23,6 +23,27 @@ class TestQuerysize(TestCase):
             settings.COMPUTEDFIELDS_QUERYSIZE
         )
 
+    def test_cached_setting_invalidated(self):
+        value = settings.COMPUTEDFIELDS_QUERYSIZE
+        with self.settings(COMPUTEDFIELDS_QUERYSIZE=123):
+            self.assertEqual(settings.COMPUTEDFIELDS_QUERYSIZE, 123)
+        self.assertEqual(settings.COMPUTEDFIELDS_QUERYSIZE, value)
+
+    def test_batchsize_bulk_backend_default(self):
+        from unittest import mock
+        from django.db import connections
+        self.assertIsNone(settings.COMPUTEDFIELDS_BATCHSIZE_BULK)
+        # resolved per database from its vendor
+        with mock.patch.object(active_resolver, 'use_fastupdate', False), \
+                mock.patch.object(active_resolver, 'use_copyupdate', False):
+            with mock.patch.object(connections['default'], 'vendor', 'postgresql'):
+                self.assertEqual(active_resolver._get_batchsize('default'), 1000)
+            with mock.patch.object(connections['default'], 'vendor', 'sqlite'):
+                self.assertEqual(active_resolver._get_batchsize('default'), 500)
+                # an explicit setting always wins
+                with self.settings(COMPUTEDFIELDS_BATCHSIZE_BULK=42):
+                    self.assertEqual(active_resolver._get_batchsize('default'), 42)
+
     def test_lowest_in_updates(self):
         # the lowest local cf value always wins
         self.assertEqual(active_resolver.get_querysize(Querysize), 1)
@@ -3,12 +3,12 @@ import operator
 from django.test import TestCase
 
 from computedfields.resolver import Resolver
-from ..models import ParentNotO, ChildNotO, SubChildNotO, ParentO, ChildO, SubChildO
+from ..models import ParentNotO, ChildNotO, SubChildNotO, ParentO, ChildO, SubChildO, UnionA, UnionB, UnionC
 from ..models import (ParentReverseNotO, ChildReverseNotO, SubChildReverseNotO,
                       ParentReverseO, ChildReverseO, SubChildReverseO)
 from django.test.utils import CaptureQueriesContext
 from django.db import connection
-from computedfields.models import preupdate_dependent, update_dependent
+from computedfields.models import preupdate_dependent, update_dependent, update_computedfields_bulk, active_resolver
 
 
 class SelectRelatedOptimization(TestCase):
@@ -171,3 +171,97 @@ class PipeQueriesOptimization(TestCase):
         with self.subTest("Queries with were statement based on different models."):
             pipe_method = Resolver()._choose_optimal_query_pipe_method({'A__field1', 'B__field2'})
             self.assertNotEqual(operator.or_, pipe_method)
+
+
+class SelectRelatedBulkLocal(TestCase):
+    def setUp(self):
+        self.p1 = ParentO.objects.create(name='p1')
+        self.c1 = ChildO.objects.create(name='c1', parent=self.p1)
+        self.c2 = ChildO.objects.create(name='c2', parent=self.p1)
+        for i in range(10):
+            SubChildO.objects.create(name='s{}'.format(i), parent=self.c1 if i % 2 else self.c2)
+
+    def test_update_computedfields_bulk(self):
+        objs = list(SubChildO.objects.all().order_by('pk'))
+        with CaptureQueriesContext(connection) as queries:
+            fields = update_computedfields_bulk(objs, ['parent'])
+        # one query for parent, one for parent__parent
+        self.assertEqual(len(queries.captured_queries), 2)
+        self.assertEqual(fields, {'parent', 'parents'})
+        self.assertEqual(objs[0].parents, 's0$c2$p1')
+        self.assertEqual(objs[1].parents, 's1$c1$p1')
+
+
+class DistinctOptimization(TestCase):
+    def setUp(self):
+        self.p1 = ParentO.objects.create(name='p1')
+        self.c1 = ChildO.objects.create(name='c1', parent=self.p1)
+        SubChildO.objects.create(name='s1', parent=self.c1)
+
+    def test_no_distinct_without_joins(self):
+        with CaptureQueriesContext(connection) as queries:
+            update_dependent(SubChildO.objects.filter(pk__in=SubChildO.objects.all()))
+        self.assertFalse(any('DISTINCT' in q['sql'] for q in queries.captured_queries))
+
+    def test_distinct_with_joins(self):
+        with CaptureQueriesContext(connection) as queries:
+            update_dependent(SubChildO.objects.filter(parent__parent__name='p1'))
+        self.assertTrue(any('DISTINCT' in q['sql'] for q in queries.captured_queries))
+
+    def test_distinct_pk_list(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = active_resolver._querysets_for_update(ParentO, self.p1, pk_list=True)
+        self.assertEqual(data[SubChildO][0], set(SubChildO.objects.values_list('pk', flat=True)))
+        self.assertTrue(all('DISTINCT' in q['sql'] for q in queries.captured_queries))
+
+
+class UnionPkSubqueries(TestCase):
+    def setUp(self):
+        self.a1 = UnionA.objects.create(name='a1')
+        self.a2 = UnionA.objects.create(name='a2')
+        self.b1 = UnionB.objects.create(a=self.a1)
+        self.b2 = UnionB.objects.create(a=self.a2)
+        self.c1 = UnionC.objects.create(a=self.a1, b=self.b2)
+        self.c2 = UnionC.objects.create(a=self.a2, b=self.b1)
+        self.c3 = UnionC.objects.create(a=self.a2, b=self.b2)
+
+    def test_queryset_filterable(self):
+        queryset, fields = active_resolver._querysets_for_update(UnionA, self.a1)[UnionC]
+        self.assertIsNone(queryset.query.combinator)
+        self.assertEqual(set(queryset), {self.c1, self.c2})
+        self.assertEqual(fields, {'names'})
+        pks, _ = active_resolver._querysets_for_update(UnionA, self.a1, pk_list=True)[UnionC]
+        self.assertEqual(pks, {self.c1.pk, self.c2.pk})
+
+    def test_update(self):
+        self.a1.name = 'x'
+        self.a1.save()
+        self.assertEqual(
+            list(UnionC.objects.order_by('pk').values_list('names', flat=True)),
+            ['x$a2', 'a2$x', 'a2$a2']
+        )
+
+
+class LoadDependsOnly(TestCase):
+    def setUp(self):
+        self.a1 = UnionA.objects.create(name='a1')
+        self.b1 = UnionB.objects.create(a=self.a1)
+        self.c1 = UnionC.objects.create(a=self.a1, b=self.b1)
+        active_resolver._load_depends_only = True
+
+    def tearDown(self):
+        active_resolver._load_depends_only = False
+
+    def test_local_reads(self):
+        plan = active_resolver._get_bulk_plan_cached(UnionC, None)
+        self.assertEqual(plan[-1], ('a', 'a__name', 'b', 'b__a', 'b__a__name', 'id', 'names'))
+
+    def test_bulk_updater(self):
+        UnionA.objects.filter(pk=self.a1.pk).update(name='x')
+        with CaptureQueriesContext(connection) as queries:
+            active_resolver.bulk_updater(UnionC.objects.all(), None)
+        # neither the local nor the joined notes columns are loaded
+        self.assertNotIn('notes', queries.captured_queries[0]['sql'])
+        self.assertIn('JOIN', queries.captured_queries[0]['sql'])
+        self.c1.refresh_from_db()
+        self.assertEqual(self.c1.names, 'x$x')
@@ -13,7 +13,7 @@ from computedfields.resolver import Resolver, active_resolver, ResolverException
 from .. import models
 
 
-def generate_computedmodel(resolver, modelname, func, wrong_base=False):
+def generate_computedmodel(resolver, modelname, func, wrong_base=False, attrs=None):
     from django.db import models
     from computedfields.models import ComputedFieldsModel
     field = resolver.computed(models.CharField(max_length=32), depends=[('self', ['name'])])(func)
@@ -23,7 +23,8 @@ def generate_computedmodel(resolver, modelname, func, wrong_base=False):
       {
           '__module__': 'test_full.models',
           'name': models.CharField(max_length=32),
-          'comp': field
+          'comp': field,
+          **(attrs or {})
       }
     )
 
@@ -154,3 +155,69 @@ class TestResolverInstance(TestCase):
         self.assertEqual(self.resolver.is_computedfield(rt_model, 'name'), False)
         self.assertEqual(self.resolver.is_computedfield(rt_model, 'comp'), True)
         self.assertEqual(self.resolver.is_computedfield(models.Concrete, 'name'), False)
+
+    def test_local_mro_memoized(self):
+        class_prepared.connect(self.resolver.add_model)
+        rt_field, rt_model = generate_computedmodel(self.resolver, 'RuntimeGeneratedI', lambda self: self.name.upper())
+        class_prepared.disconnect(self.resolver.add_model)
+        self.resolver.initialize()
+
+        # same update_fields in any order should hit the cache
+        mro = self.resolver.get_local_mro(rt_model, ['name', 'comp'])
+        self.assertEqual(mro, ['comp'])
+        self.assertIs(self.resolver.get_local_mro(rt_model, ('comp', 'name')), mro)
+
+        # update_fields resulting in the same bitmask share the mro list,
+        # a full mask resolves to the base mro
+        self.assertIs(self.resolver.get_local_mro(rt_model, ['name', 'xy']), mro)
+        self.assertIs(mro, self.resolver.get_local_mro(rt_model, None))
+
+        # merged update_fields are reused as well
+        fields = self.resolver.update_computedfields(rt_model(name='a'), ['name'])
+        self.assertEqual(fields, {'name', 'comp'})
+        self.assertIs(self.resolver.update_computedfields(rt_model(name='b'), {'name'}), fields)
+
+        # resolved compute funcs are cached per update_fields as well
+        funcs = self.resolver._get_compute_funcs_cached(rt_model, frozenset(['name']))
+        self.assertEqual([name for name, _, _ in funcs], ['comp'])
+        self.assertIs(self.resolver._get_compute_funcs_cached(rt_model, frozenset(['name'])), funcs)
+
+        # map reloading invalidates the cache
+        self.resolver.load_maps(_force_recreation=True)
+        self.assertIsNot(self.resolver.get_local_mro(rt_model, ['name', 'comp']), mro)
+        self.assertIsNot(self.resolver._get_compute_funcs_cached(rt_model, frozenset(['name'])), funcs)
+
+    def test_plain_fields(self):
+        class_prepared.connect(self.resolver.add_model)
+        rt_field, rt_model = generate_computedmodel(self.resolver, 'RuntimeGeneratedJ', lambda self: self.name.upper())
+        class_prepared.disconnect(self.resolver.add_model)
+        self.resolver.initialize()
+        self.assertEqual(self.resolver._plain_fields, {rt_model: frozenset(['comp'])})
+
+        # values of plain fields get written directly to instance.__dict__
+        inst = rt_model(name='abc')
+        self.resolver.update_computedfields(inst)
+        self.assertEqual(inst.__dict__['comp'], 'ABC')
+
+    def test_plain_fields_custom_setattr(self):
+        def __setattr__(self, name, value):
+            # dirty tracking like mixins must see computed field writes
+            self.__dict__.setdefault('_written', []).append(name)
+            super(type(self), self).__setattr__(name, value)
+
+        class_prepared.connect(self.resolver.add_model)
+        rt_field, rt_model = generate_computedmodel(
+            self.resolver, 'RuntimeGeneratedK', lambda self: self.name.upper(),
+            attrs={'__setattr__': __setattr__})
+        class_prepared.disconnect(self.resolver.add_model)
+        self.resolver.initialize()
+        self.assertEqual(self.resolver._plain_fields, {rt_model: frozenset()})
+
+        inst = rt_model(name='abc')
+        inst._written.clear()
+        self.resolver.update_computedfields(inst)
+        self.assertEqual(inst.comp, 'ABC')
+        self.assertIn('comp', inst._written)
+        inst._written.clear()
+        self.resolver.update_computedfields_bulk([inst])
+        self.assertIn('comp', inst._written)